@@ -5,10 +5,12 @@ Generates ICS calendar files showing session periods as multi-day blocks
 Groups consecutive session days together for cleaner calendar display
 """
 
+import argparse
+import hashlib
 import os
-from datetime import datetime, timedelta, date
-from icalendar import Calendar, Event
-import pytz
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import datetime, date, timezone
 
 # State postal abbreviations
 STATE_ABBREV = {
@@ -27,8 +29,8 @@ STATE_ABBREV = {
     'Wisconsin': 'WI', 'Wyoming': 'WY'
 }
 
-# Federal holidays for 2026
-FEDERAL_HOLIDAYS_2026 = [
+# Federal holidays for 2026 (a frozenset, since it's only used for membership tests)
+FEDERAL_HOLIDAYS_2026 = frozenset({
     date(2026, 1, 1),   # New Year's Day
     date(2026, 1, 19),  # Martin Luther King Jr. Day
     date(2026, 2, 16),  # Presidents' Day
@@ -40,7 +42,10 @@ FEDERAL_HOLIDAYS_2026 = [
     date(2026, 11, 26), # Thanksgiving
     date(2026, 11, 27), # Day after Thanksgiving
     date(2026, 12, 25), # Christmas
-]
+})
+
+# The same holidays as sorted date ordinals, for the session day bitmasks
+FEDERAL_HOLIDAY_ORDINALS_2026 = tuple(sorted(holiday.toordinal() for holiday in FEDERAL_HOLIDAYS_2026))
 
 # Session data for 2026 - All 50 States + Federal
 LEGISLATIVE_SESSIONS_2026 = {
@@ -438,110 +443,284 @@ LEGISLATIVE_SESSIONS_2026 = {
     }
 }
 
-def get_state_abbrev(state_name):
-    """Get postal abbreviation for a state, or return the state name if not found"""
+def to_date(value):
+    """Return value as a date, parsing 'YYYY-MM-DD' strings"""
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    return value
+
+def merge_recess_periods(recess_periods):
+    """Sort (start, end) date pairs and merge any that overlap or touch"""
+    merged = []
+    for start, end in sorted(recess_periods):
+        if merged and start.toordinal() <= merged[-1][1].toordinal() + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+def normalize_session(session_data):
+    """Replace a session's ISO date strings with date objects, in place
+    
+    Recess periods end up sorted by start date and non-overlapping.
+    """
+    session_data['start_date'] = to_date(session_data['start_date'])
+    session_data['end_date'] = to_date(session_data['end_date'])
+    session_data['recess_periods'] = merge_recess_periods(
+        (to_date(start), to_date(end))
+        for start, end in session_data.get('recess_periods', [])
+    )
+    return session_data
+
+# Parse every session date once at import, instead of on every use
+for session_data in LEGISLATIVE_SESSIONS_2026.values():
+    normalize_session(session_data)
+
+# Fixed ICS text for the calendar writer. Property order here and in
+# make_vevent_formatter matches the files originally produced with icalendar,
+# so the published calendars don't churn.
+CALENDAR_DESCRIPTION = 'Legislative session periods (excludes weekends, holidays, recesses)'
+
+CALENDAR_HEADER = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//Beekeeper Group//Legislative Calendar 2026//EN\r\n"
+    "CALSCALE:GREGORIAN\r\n"
+    "METHOD:PUBLISH\r\n"
+    "{caldesc}\r\n"
+    "{calname}\r\n"
+    "X-WR-TIMEZONE:America/New_York\r\n"
+    "X-SIG:{signature}\r\n"
+)
+
+CALENDAR_FOOTER = b"END:VCALENDAR\r\n"
+
+# Part of every calendar's X-SIG input signature. The script's own source
+# covers the session data, STATE_ABBREV and the ICS writer, so any edit to
+# this file regenerates every calendar with no version number to remember
+with open(__file__, 'rb') as script_file:
+    SCRIPT_DIGEST = hashlib.sha256(script_file.read()).hexdigest()
+
+# Longest names first, so "West Virginia" matches before "Virginia" does
+STATE_ABBREV_LONGEST_FIRST = sorted(STATE_ABBREV.items(), key=lambda item: len(item[0]), reverse=True)
+
+@lru_cache(maxsize=None)
+def scan_state_abbrev(state_name):
+    """Find the postal abbreviation by scanning STATE_ABBREV for a contained state name"""
     # Extract just the state name (e.g., "California" from "California State Legislature")
-    for state, abbrev in STATE_ABBREV.items():
+    for state, abbrev in STATE_ABBREV_LONGEST_FIRST:
         if state in state_name:
             return abbrev
     return state_name
 
-def is_weekday(check_date):
-    """Check if date is a weekday (Monday-Friday)"""
-    return check_date.weekday() < 5
-
-def is_in_recess(check_date, recess_periods):
-    """Check if date falls within any recess period"""
-    for start_str, end_str in recess_periods:
-        start = datetime.strptime(start_str, '%Y-%m-%d').date()
-        end = datetime.strptime(end_str, '%Y-%m-%d').date()
-        if start <= check_date <= end:
-            return True
-    return False
-
-def generate_session_days(session_data):
-    """Generate list of actual session days (weekdays, not holidays, not in recess)"""
+# Abbreviations for every known session name, resolved once at import
+SESSION_NAME_TO_ABBREV = {
+    session_data['name']: scan_state_abbrev(session_data['name'])
+    for session_data in LEGISLATIVE_SESSIONS_2026.values()
+}
+
+def get_state_abbrev(state_name):
+    """Get postal abbreviation for a state, or return the state name if not found"""
+    abbrev = SESSION_NAME_TO_ABBREV.get(state_name)
+    if abbrev is None:
+        abbrev = scan_state_abbrev(state_name)
+    return abbrev
+
+def day_range_mask(first_ordinal, last_ordinal, base_ordinal):
+    """Bitmask with one bit set per day from first_ordinal to last_ordinal, counted from base_ordinal"""
+    return ((1 << (last_ordinal - first_ordinal + 1)) - 1) << (first_ordinal - base_ordinal)
+
+@lru_cache(maxsize=None)
+def business_day_mask(start_ordinal, num_days):
+    """Bitmask of the weekdays that aren't federal holidays in a run of num_days days
+    
+    Bit i stands for day start_ordinal + i. Sessions sharing a date range (the
+    House and Senate, for instance) share one cached mask.
+    """
+    # Weekday pattern of the first week, repeated across the whole range.
+    # Ordinal 1 (0001-01-01) is a Monday, so (ordinal - 1) % 7 is the weekday.
+    first_week = sum(1 << i for i in range(7) if (start_ordinal + i - 1) % 7 < 5)
+    num_weeks = num_days // 7 + 1
+    weekday_mask = first_week * (((1 << (7 * num_weeks)) - 1) // 0x7F)
+    
+    holiday_mask = 0
+    end_ordinal = start_ordinal + num_days - 1
+    for holiday_ordinal in FEDERAL_HOLIDAY_ORDINALS_2026:
+        if holiday_ordinal > end_ordinal:
+            break
+        if holiday_ordinal >= start_ordinal:
+            holiday_mask |= 1 << (holiday_ordinal - start_ordinal)
+    
+    return weekday_mask & ~holiday_mask & ((1 << num_days) - 1)
+
+def session_day_mask(session_data):
+    """Return (start_ordinal, mask) where bit i is set iff day start_ordinal + i is a session day
+    
+    The business-day mask for the session range has recess days cleared from it,
+    using a few big-int operations instead of testing every date. Days are
+    handled as date ordinals (plain ints) so no timedelta objects are created.
+    """
     # Handle states with no 2026 session
     if session_data['start_date'] is None or session_data['end_date'] is None:
-        return []
-    
-    start_date = datetime.strptime(session_data['start_date'], '%Y-%m-%d').date()
-    end_date = datetime.strptime(session_data['end_date'], '%Y-%m-%d').date()
-    recess_periods = session_data.get('recess_periods', [])
-    
-    session_days = []
-    current_date = start_date
+        return None, 0
+    
+    start_ordinal = session_data['start_date'].toordinal()
+    end_ordinal = session_data['end_date'].toordinal()
+    num_days = end_ordinal - start_ordinal + 1
+    if num_days <= 0:
+        return start_ordinal, 0
+    
+    # Recesses are sorted by start date, so stop at the first one past the session
+    # and clip the rest to the session range
+    recess_mask = 0
+    for recess_start, recess_end in session_data['recess_periods']:
+        recess_start_ordinal = recess_start.toordinal()
+        if recess_start_ordinal > end_ordinal:
+            break
+        first_ordinal = max(recess_start_ordinal, start_ordinal)
+        last_ordinal = min(recess_end.toordinal(), end_ordinal)
+        if first_ordinal <= last_ordinal:
+            recess_mask |= day_range_mask(first_ordinal, last_ordinal, start_ordinal)
+    
+    return start_ordinal, business_day_mask(start_ordinal, num_days) & ~recess_mask
+
+def mask_runs(mask):
+    """Yield (first_bit, last_bit) for each run of consecutive set bits in mask"""
+    while mask:
+        first_bit = (mask & -mask).bit_length() - 1
+        shifted = mask >> first_bit
+        # shifted + 1 carries through the run of trailing ones, leaving one bit at its length
+        run_length = (~shifted & (shifted + 1)).bit_length() - 1
+        yield first_bit, first_bit + run_length - 1
+        mask &= ~(((1 << run_length) - 1) << first_bit)
+
+def escape_text(value):
+    """Escape an ICS TEXT value (backslash, semicolon, comma, newline)"""
+    return (value.replace('\\', '\\\\')
+                 .replace(';', '\\;')
+                 .replace(',', '\\,')
+                 .replace('\n', '\\n'))
+
+def fold_line(line):
+    """Fold a content line into 74-character segments joined by CRLF + space"""
+    # Same split points as icalendar's folding for the ASCII text we emit
+    return '\r\n '.join(line[i:i + 74] for i in range(0, len(line), 74))
+
+def format_ics_timestamp(dtstamp):
+    """Format an aware datetime as an ICS UTC timestamp, e.g. 20260126T092210Z"""
+    return f"{dtstamp.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}"
+
+def make_vevent_formatter(session_id, session_name, ics_dtstamp):
+    """Return a function that renders one session's block events as ICS text
+    
+    The summary prefix, DTSTAMP and UID prefix are the same for every block in a
+    session, so they're baked in once here; the returned function only fills in
+    the block dates, length and number.
+    """
+    summary_prefix = f"SUMMARY:{escape_text(get_state_abbrev(session_name))} - In Session"
+    stamp_and_uid = f"DTSTAMP:{ics_dtstamp}\r\nUID:{session_id}-2026-block-"
+    trailer = (
+        "@legislative-calendar.beekeepergroup.com\r\n"
+        "DESCRIPTION:Legislature in session\r\n"
+        "TRANSP:TRANSPARENT\r\n"
+        "END:VEVENT\r\n"
+    )
     
-    while current_date <= end_date:
-        # Include only if: weekday, not a federal holiday, not in recess
-        if (is_weekday(current_date) and 
-            current_date not in FEDERAL_HOLIDAYS_2026 and 
-            not is_in_recess(current_date, recess_periods)):
-            session_days.append(current_date)
+    def format_vevent(block_start, block_end, block_num):
+        num_days = block_end.toordinal() - block_start.toordinal() + 1
+        summary = summary_prefix if num_days == 1 else f"{summary_prefix} ({num_days} days)"
         
-        current_date += timedelta(days=1)
+        # ICS end dates are exclusive, so add one day
+        ics_end_date = date.fromordinal(block_end.toordinal() + 1)
+        return (
+            f"BEGIN:VEVENT\r\n{fold_line(summary)}\r\n"
+            f"DTSTART;VALUE=DATE:{block_start:%Y%m%d}\r\n"
+            f"DTEND;VALUE=DATE:{ics_end_date:%Y%m%d}\r\n"
+            f"{stamp_and_uid}{block_num}{trailer}"
+        )
     
-    return session_days
+    return format_vevent
 
-def group_consecutive_days(session_days):
-    """Group consecutive session days into blocks"""
-    if not session_days:
-        return []
-    
-    blocks = []
-    current_block_start = session_days[0]
-    current_block_end = session_days[0]
-    
-    for i in range(1, len(session_days)):
-        # Check if this day is consecutive (next day after current_block_end)
-        if session_days[i] == current_block_end + timedelta(days=1):
-            # Extend the current block
-            current_block_end = session_days[i]
-        else:
-            # Gap found - save current block and start new one
-            blocks.append((current_block_start, current_block_end))
-            current_block_start = session_days[i]
-            current_block_end = session_days[i]
-    
-    # Don't forget the last block
-    blocks.append((current_block_start, current_block_end))
-    
-    return blocks
+@lru_cache(maxsize=None)
+def compute_session_blocks(session_id):
+    """Return (num_session_days, session_blocks) for a session, computed once per run
+    
+    The blocks are a tuple, since every caller shares the same cached result.
+    Days stay as bits in the session mask until a block's endpoints are emitted.
+    """
+    start_ordinal, mask = session_day_mask(LEGISLATIVE_SESSIONS_2026[session_id])
+    if not mask:
+        return 0, ()
+    
+    session_blocks = tuple(
+        (date.fromordinal(start_ordinal + first), date.fromordinal(start_ordinal + last))
+        for first, last in mask_runs(mask)
+    )
+    return mask.bit_count(), session_blocks
 
-def create_session_block_event(session_id, session_name, block_start, block_end, block_num):
-    """Create an all-day event for a session block"""
-    event = Event()
-    
-    # ICS end dates are exclusive, so add one day
-    ics_end_date = block_end + timedelta(days=1)
-    
-    # Calculate number of days in block
-    num_days = (block_end - block_start).days + 1
-    
-    # Get state abbreviation if it's a state
-    state_abbrev = get_state_abbrev(session_name)
-    
-    if num_days == 1:
-        summary = f"{state_abbrev} - In Session"
-    else:
-        summary = f"{state_abbrev} - In Session ({num_days} days)"
-    
-    event.add('summary', summary)
-    event.add('dtstart', block_start)
-    event.add('dtend', ics_end_date)
-    event.add('description', f"Legislature in session")
-    event.add('uid', f'{session_id}-2026-block-{block_num}@legislative-calendar.beekeepergroup.com')
-    event.add('dtstamp', datetime.now(pytz.UTC))
-    
-    # Mark as transparent so it doesn't block calendars
-    event.add('transp', 'TRANSPARENT')
-    
-    return event
+@lru_cache(maxsize=None)
+def render_session_vevents(session_id, ics_dtstamp):
+    """Render every block event for a session as one UTF-8 encoded ICS fragment
+    
+    Cached so the regional and combined calendars reuse the fragments already
+    rendered for the individual calendars.
+    """
+    format_vevent = make_vevent_formatter(
+        session_id, LEGISLATIVE_SESSIONS_2026[session_id]['name'], ics_dtstamp
+    )
+    _, session_blocks = compute_session_blocks(session_id)
+    return ''.join(
+        format_vevent(block_start, block_end, block_num)
+        for block_num, (block_start, block_end) in enumerate(session_blocks)
+    ).encode('utf-8')
 
-def generate_calendar(sessions_to_include, output_filename, calendar_title=None):
-    """Generate an ICS calendar file for specified sessions"""
-    cal = Calendar()
-    
+def calendar_signature(sessions_to_include, calendar_title):
+    """Hash everything a calendar file's content depends on, except DTSTAMP"""
+    payload = repr((
+        SCRIPT_DIGEST,
+        calendar_title,
+        sorted(FEDERAL_HOLIDAYS_2026),
+        [(session_id, LEGISLATIVE_SESSIONS_2026.get(session_id)) for session_id in sessions_to_include],
+    ))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+def read_calendar_signature(output_filename):
+    """Return the X-SIG value from an existing calendar file's header, or None
+    
+    Files that don't end with CALENDAR_FOOTER (a truncated write, say) report
+    no signature, so they're always regenerated.
+    """
+    try:
+        with open(output_filename, 'rb') as f:
+            header = f.read(1024)
+            f.seek(0, os.SEEK_END)
+            if f.tell() < len(CALENDAR_FOOTER):
+                return None
+            f.seek(-len(CALENDAR_FOOTER), os.SEEK_END)
+            if f.read() != CALENDAR_FOOTER:
+                return None
+    except OSError:
+        return None
+    
+    for line in header.split(b'\r\n'):
+        if line.startswith(b'X-SIG:'):
+            return line[len(b'X-SIG:'):].decode('ascii')
+        if line == b'BEGIN:VEVENT':
+            break
+    return None
+
+def generate_calendar(sessions_to_include, output_filename, calendar_title=None,
+                      dtstamp=None, log=print, verbose=True, force=False):
+    """Generate an ICS calendar file for specified sessions
+    
+    Events are written as ICS text directly. Pass the same dtstamp to every
+    call in a run so cached session fragments can be reused. Progress messages
+    are collected and handed to log (print by default) in a single call;
+    verbose=False leaves out the per-session lines.
+    
+    Files carry an X-SIG signature of their inputs, and are left untouched when
+    the existing file's signature already matches (unless force).
+    """
     # Determine calendar title
     if calendar_title is None:
         if len(sessions_to_include) == 1:
@@ -551,70 +730,109 @@ def generate_calendar(sessions_to_include, output_filename, calendar_title=None)
         else:
             calendar_title = "Legislative Sessions Calendar 2026"
     
-    # Calendar metadata
-    cal.add('prodid', '-//Beekeeper Group//Legislative Calendar 2026//EN')
-    cal.add('version', '2.0')
-    cal.add('calscale', 'GREGORIAN')
-    cal.add('method', 'PUBLISH')
-    cal.add('x-wr-calname', calendar_title)
-    cal.add('x-wr-timezone', 'America/New_York')
-    cal.add('x-wr-caldesc', 'Legislative session periods (excludes weekends, holidays, recesses)')
+    # One timestamp for the whole file, so every event shares the same DTSTAMP
+    if dtstamp is None:
+        dtstamp = datetime.now(timezone.utc)
     
     total_blocks = 0
     total_days = 0
+    messages = []
+    found_sessions = []
     
-    # Add events for each session
     for session_id in sessions_to_include:
         if session_id not in LEGISLATIVE_SESSIONS_2026:
-            print(f"Warning: Session {session_id} not found in data")
+            messages.append(f"Warning: Session {session_id} not found in data")
             continue
-            
-        session_data = LEGISLATIVE_SESSIONS_2026[session_id]
-        session_days = generate_session_days(session_data)
-        session_blocks = group_consecutive_days(session_days)
-        
-        for block_num, (block_start, block_end) in enumerate(session_blocks):
-            event = create_session_block_event(
-                session_id, 
-                session_data['name'], 
-                block_start, 
-                block_end,
-                block_num
-            )
-            cal.add_component(event)
         
+        found_sessions.append(session_id)
+        num_session_days, session_blocks = compute_session_blocks(session_id)
         total_blocks += len(session_blocks)
-        total_days += len(session_days)
-        print(f"  {session_data['name']}: {len(session_blocks)} blocks, {len(session_days)} session days")
+        total_days += num_session_days
+        if verbose:
+            session_name = LEGISLATIVE_SESSIONS_2026[session_id]['name']
+            messages.append(f"  {session_name}: {len(session_blocks)} blocks, {num_session_days} session days")
+    
+    summary = f"({total_blocks} blocks, {total_days} total days)"
+    
+    signature = calendar_signature(sessions_to_include, calendar_title)
+    if not force and read_calendar_signature(output_filename) == signature:
+        messages.append(f"✓ Up to date: {output_filename} {summary}")
+        log('\n'.join(messages))
+        return output_filename
+    
+    # Stream the header, each session's events and the footer straight to a
+    # temporary file rather than assembling the whole calendar in memory first,
+    # then move it into place so an interrupted write never leaves a partial
+    # calendar behind under the real name
+    ics_dtstamp = format_ics_timestamp(dtstamp)
+    temp_filename = f"{output_filename}.tmp"
+    try:
+        with open(temp_filename, 'wb', buffering=1 << 16) as f:
+            f.write(CALENDAR_HEADER.format(
+                caldesc=fold_line(f"X-WR-CALDESC:{escape_text(CALENDAR_DESCRIPTION)}"),
+                calname=fold_line(f"X-WR-CALNAME:{escape_text(calendar_title)}"),
+                signature=signature
+            ).encode('utf-8'))
+            for session_id in found_sessions:
+                f.write(render_session_vevents(session_id, ics_dtstamp))
+            f.write(CALENDAR_FOOTER)
+        os.replace(temp_filename, output_filename)
+    except BaseException:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
+    
+    messages.append(f"✓ Generated: {output_filename} {summary}")
+    log('\n'.join(messages))
+    return output_filename
+
+def generate_calendars_parallel(calendar_jobs, dtstamp, force=False):
+    """Generate several calendars concurrently
+    
+    Each job is a dict of generate_calendar keyword arguments (at least
+    sessions_to_include, output_filename and calendar_title). Returns each
+    job's progress messages, in job order, for the caller to print. force is
+    passed through to every generate_calendar call.
+    """
+    # Render each distinct session's events once up front, so worker threads only
+    # concatenate cached fragments and write
+    ics_dtstamp = format_ics_timestamp(dtstamp)
+    session_ids = dict.fromkeys(
+        session_id
+        for job in calendar_jobs
+        for session_id in job['sessions_to_include']
+        if session_id in LEGISLATIVE_SESSIONS_2026
+    )
+    for session_id in session_ids:
+        render_session_vevents(session_id, ics_dtstamp)
     
-    # Write to file
-    with open(output_filename, 'wb') as f:
-        f.write(cal.to_ical())
+    def run_job(job):
+        messages = []
+        generate_calendar(**job, dtstamp=dtstamp, log=messages.append, force=force)
+        return messages
     
-    print(f"✓ Generated: {output_filename} ({total_blocks} blocks, {total_days} total days)")
-    return output_filename
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(run_job, calendar_jobs))
 
-def main():
+def main(argv=None):
     """Main function to generate all calendar files"""
+    parser = argparse.ArgumentParser(description="Generate 2026 legislative session ICS calendars")
+    parser.add_argument('--force', action='store_true',
+                        help="rewrite every calendar, even ones whose X-SIG signature already matches")
+    args = parser.parse_args(argv)
     
     # Create output directory
     os.makedirs('output', exist_ok=True)
     
+    # Shared by every file so cached session fragments are reused run-wide
+    dtstamp = datetime.now(timezone.utc)
+    
     print("Legislative Calendar Generator - 2026 Edition v4")
     print("Multi-day Session Blocks - ALL 50 STATES + FEDERAL")
     print("With State Postal Abbreviations in Titles")
     print("=" * 70)
     print()
     
-    # Generate combined federal calendar
-    print("Generating Federal Legislative Calendar...")
-    generate_calendar(
-        ['US_House', 'US_Senate'],
-        'output/federal_legislative_calendar_2026.ics',
-        'Federal - 2026 Legislative Session'
-    )
-    print()
-    
     # Get all states (excluding those with no 2026 sessions)
     all_states = [key for key in LEGISLATIVE_SESSIONS_2026.keys() 
                   if key not in ['US_House', 'US_Senate'] 
@@ -622,69 +840,81 @@ def main():
     
     # Sort alphabetically by state name
     all_states.sort()
-    
-    # Generate individual state calendars
-    print("Generating Individual State Calendars...")
-    print("=" * 70)
-    for state in all_states:
-        session_data = LEGISLATIVE_SESSIONS_2026[state]
-        state_name = session_data['name']
-        state_abbrev = get_state_abbrev(state_name)
-        print(f"{state_name} ({state_abbrev}):")
-        generate_calendar(
-            [state],
-            f'output/{state.lower()}_legislative_calendar_2026.ics',
-            f'{state_abbrev} - 2026 Legislative Session'
-        )
-        print()
-    
-    # Generate combined calendar (all sessions)
-    print("=" * 70)
-    print("Generating Combined Federal + All States Calendar...")
-    all_sessions = ['US_House', 'US_Senate'] + all_states
-    generate_calendar(
-        all_sessions,
-        'output/all_legislative_sessions_2026.ics',
-        'All Legislative Sessions - 2026'
-    )
-    print()
-    
-    # Generate regional groupings
-    print("=" * 70)
-    print("Generating Regional Calendars...")
+    state_abbrevs = {state: get_state_abbrev(LEGISLATIVE_SESSIONS_2026[state]['name'])
+                     for state in all_states}
     
     northeast = ['Connecticut', 'Maine', 'Massachusetts', 'New_Hampshire', 
                  'New_Jersey', 'New_York', 'Pennsylvania', 'Rhode_Island', 'Vermont']
-    generate_calendar(
-        northeast,
-        'output/northeast_states_2026.ics',
-        'Northeast States - 2026 Legislative Sessions'
-    )
-    
     southeast = ['Alabama', 'Arkansas', 'Florida', 'Georgia', 'Kentucky',
                  'Louisiana', 'Mississippi', 'North_Carolina', 'South_Carolina',
                  'Tennessee', 'Virginia', 'West_Virginia']
-    generate_calendar(
-        southeast,
-        'output/southeast_states_2026.ics',
-        'Southeast States - 2026 Legislative Sessions'
-    )
-    
     midwest = ['Illinois', 'Indiana', 'Iowa', 'Kansas', 'Michigan',
                'Minnesota', 'Missouri', 'Nebraska', 'Ohio', 'South_Dakota', 'Wisconsin']
-    generate_calendar(
-        midwest,
-        'output/midwest_states_2026.ics',
-        'Midwest States - 2026 Legislative Sessions'
-    )
-    
     west = ['Alaska', 'Arizona', 'California', 'Colorado', 'Hawaii',
             'Idaho', 'New_Mexico', 'Oklahoma', 'Oregon', 'Utah', 'Washington', 'Wyoming']
-    generate_calendar(
-        west,
-        'output/west_states_2026.ics',
-        'West States - 2026 Legislative Sessions'
+    
+    # Every output file is queued up front and written in one batch, so the
+    # writes for all of them overlap; progress is printed afterwards in order
+    federal_job = {
+        'sessions_to_include': ['US_House', 'US_Senate'],
+        'output_filename': 'output/federal_legislative_calendar_2026.ics',
+        'calendar_title': 'Federal - 2026 Legislative Session',
+    }
+    state_jobs = [{
+        'sessions_to_include': [state],
+        'output_filename': f'output/{state.lower()}_legislative_calendar_2026.ics',
+        'calendar_title': f'{state_abbrevs[state]} - 2026 Legislative Session',
+    } for state in all_states]
+    combined_job = {
+        'sessions_to_include': ['US_House', 'US_Senate'] + all_states,
+        'output_filename': 'output/all_legislative_sessions_2026.ics',
+        'calendar_title': 'All Legislative Sessions - 2026',
+        'verbose': False,
+    }
+    regional_jobs = [
+        {'sessions_to_include': sessions, 'output_filename': filename,
+         'calendar_title': title, 'verbose': False}
+        for sessions, filename, title in [
+            (northeast, 'output/northeast_states_2026.ics', 'Northeast States - 2026 Legislative Sessions'),
+            (southeast, 'output/southeast_states_2026.ics', 'Southeast States - 2026 Legislative Sessions'),
+            (midwest, 'output/midwest_states_2026.ics', 'Midwest States - 2026 Legislative Sessions'),
+            (west, 'output/west_states_2026.ics', 'West States - 2026 Legislative Sessions'),
+        ]
+    ]
+    
+    results = generate_calendars_parallel(
+        [federal_job] + state_jobs + [combined_job] + regional_jobs, dtstamp,
+        force=args.force
     )
+    federal_messages = results[0]
+    state_messages = results[1:1 + len(state_jobs)]
+    combined_messages = results[1 + len(state_jobs)]
+    regional_messages = results[2 + len(state_jobs):]
+    
+    # Combined federal calendar
+    print("Generating Federal Legislative Calendar...")
+    print('\n'.join(federal_messages))
+    print()
+    
+    # Individual state calendars
+    print("Generating Individual State Calendars...")
+    print("=" * 70)
+    for state, messages in zip(all_states, state_messages):
+        print(f"{LEGISLATIVE_SESSIONS_2026[state]['name']} ({state_abbrevs[state]}):")
+        print('\n'.join(messages))
+        print()
+    
+    # Combined calendar (all sessions)
+    print("=" * 70)
+    print("Generating Combined Federal + All States Calendar...")
+    print('\n'.join(combined_messages))
+    print()
+    
+    # Regional groupings
+    print("=" * 70)
+    print("Generating Regional Calendars...")
+    for messages in regional_messages:
+        print('\n'.join(messages))
     
     print()
     print("=" * 70)